@@ -0,0 +1,51 @@
+from typing import Dict
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into a mapping of encoding to q-value.
+    """
+    qualities = {}
+    for part in accept_encoding.split(","):
+        encoding, *params = [p.strip() for p in part.split(";")]
+        if not encoding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[encoding.lower()] = quality
+    return qualities
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """
+    Check whether the client accepts the given encoding.
+    An explicit q-value wins over the wildcard; q=0 means refused.
+    """
+    qualities = parse_accept_encoding(accept_encoding)
+    return qualities.get(encoding, qualities.get("*", 0.0)) > 0
+
+class PrefixGZipMiddleware:
+    """
+    Apply GZipMiddleware only to requests under the given path prefix.
+    Everything else (e.g. precompressed static files) is passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, prefix: str, minimum_size: int = 500) -> None:
+        self.app = app
+        self.prefix = prefix
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.prefix):
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            if accepts_encoding(accept_encoding, "gzip"):
+                await self.gzip(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -21,6 +21,7 @@ class Settings(BaseModel):
     AZURE_OPENAI_MODEL: str = os.getenv("AZURE_OPENAI_MODEL", "gpt-4")
     AZURE_OPENAI_API_VERSION: str = os.getenv("AZURE_OPENAI_API_VERSION", "2023-03-15-preview")
     MAX_CONCURRENT_TRANSLATIONS: int = 5
+    MAX_CONCURRENT_PRIORITY_TRANSLATIONS: int = 2
 
     # Azure Document Intelligence
     AZURE_DOC_INTELLIGENCE_ENDPOINT: str = os.getenv("DOCUMENTINTELLIGENCE_ENDPOINT", "")
@@ -30,6 +31,10 @@ class Settings(BaseModel):
     TEMP_DIR: str = "/tmp/doc-processing"
     MAX_UPLOAD_SIZE: int = 40 * 1024 * 1024
 
+    # Compiled frontend bundle and response compression
+    STATIC_DIR: str = os.getenv("STATIC_DIR", str(Path(__file__).parent.parent.parent / "static"))
+    GZIP_MINIMUM_SIZE: int = 1024
+
     @field_validator('TEMP_DIR')
     @classmethod
     def create_temp_dir(cls, v):
@@ -0,0 +1,78 @@
+import os
+from fastapi import HTTPException
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Scope
+from app.core.compression import accepts_encoding
+
+# Precompressed variants generated at build time, in order of preference
+PRECOMPRESSED_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+# Requests under this prefix belong to the API and must never fall through to the bundle
+API_PREFIX = "api"
+
+# Vite emits content-hashed bundles under this prefix, so they never change
+HASHED_ASSETS_PREFIX = "assets/"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+def append_vary(response: Response, value: str) -> None:
+    """
+    Add a value to the response's Vary header without duplicating existing entries.
+    """
+    existing = [v.strip() for v in response.headers.get("Vary", "").split(",") if v.strip()]
+    if value.lower() not in (v.lower() for v in existing):
+        existing.append(value)
+    response.headers["Vary"] = ", ".join(existing)
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves precompressed .br/.gz siblings when the client accepts them,
+    and sets long-lived cache headers for hashed assets.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        normalized_path = path.replace(os.sep, "/")
+        if normalized_path == API_PREFIX or normalized_path.startswith(f"{API_PREFIX}/"):
+            raise HTTPException(status_code=404, detail="Not Found")
+
+        response = await super().get_response(path, scope)
+        if isinstance(response, FileResponse) and response.status_code == 200:
+            response = self._precompressed_response(response, scope)
+
+        if response.status_code in (200, 304):
+            append_vary(response, "Accept-Encoding")
+            if normalized_path.startswith(HASHED_ASSETS_PREFIX):
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            else:
+                response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
+
+    def _precompressed_response(self, response: FileResponse, scope: Scope) -> Response:
+        """
+        Swap the file for a precompressed variant accepted by the client, if one exists.
+        """
+        request_headers = Headers(scope=scope)
+        accept_encoding = request_headers.get("accept-encoding", "")
+
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if not accepts_encoding(accept_encoding, encoding):
+                continue
+            compressed_path = f"{response.path}{suffix}"
+            try:
+                stat_result = os.stat(compressed_path)
+            except OSError:
+                continue
+
+            compressed = FileResponse(
+                compressed_path,
+                stat_result=stat_result,
+                media_type=response.media_type,
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(compressed.headers, request_headers):
+                return Response(status_code=304, headers={"ETag": compressed.headers["etag"]})
+            return compressed
+
+        return response
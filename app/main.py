@@ -5,11 +5,14 @@ from fastapi.responses import JSONResponse
 from fastapi import HTTPException, Request
 from app.routers import files, translate, status, export, health
 from app.core.config import settings
+from app.core.compression import PrefixGZipMiddleware
 from app.core.logging_config import configure_logging
+from app.core.static_files import PrecompressedStaticFiles
 from app.services.background import shutdown_background_tasks
 from app.services.cleanup import periodic_cleanup_task
 import asyncio
 import logging
+import os
 
 # Configure logging at startup
 configure_logging()
@@ -33,6 +36,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger API responses (e.g. chapter payloads) for clients that accept gzip.
+# Static assets are left to PrecompressedStaticFiles, which serves build-time variants.
+app.add_middleware(PrefixGZipMiddleware, prefix="/api", minimum_size=settings.GZIP_MINIMUM_SIZE)
+
 # Include sub-routers
 app.include_router(files.router, prefix="/api", tags=["files"])
 app.include_router(translate.router, prefix="/api", tags=["translate"])
@@ -40,6 +47,12 @@ app.include_router(status.router, prefix="/api", tags=["status"])
 app.include_router(export.router, prefix="/api", tags=["export"])
 app.include_router(health.router, prefix="/api", tags=["health"])
 
+# Serve the compiled frontend, if present (copied to /app/static in the Docker image)
+if os.path.isdir(settings.STATIC_DIR):
+    app.mount("/", PrecompressedStaticFiles(directory=settings.STATIC_DIR, html=True), name="static")
+else:
+    logger.info(f"Static directory {settings.STATIC_DIR} not found, frontend will not be served.")
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 from app.services.storage import get_doc
-from app.services.translation import enqueue_translation_job, TranslationChapterInput
+from app.services.validation import is_valid_language_code
+from app.services.translation import enqueue_translation_job, translate_single_chapter, TranslationChapterInput
 import logging
 
 router = APIRouter()
@@ -12,6 +13,12 @@ class TranslateRequest(BaseModel):
     session_id: str = Field(..., description="ID of the document session")
     target_language: str = Field(..., description="Target language code, e.g. 'fr', 'de'")
 
+class ChapterTranslateRequest(BaseModel):
+    session_id: str = Field(..., description="ID of the document session")
+    chapter_id: str = Field(..., description="ID of the chapter to translate")
+    target_language: str = Field(..., description="Target language code, e.g. 'fr', 'de'")
+    markdown: Optional[str] = Field(None, description="Edited source Markdown; defaults to the stored chapter")
+
 @router.post("/translate")
 async def translate_document(req: TranslateRequest):
     """
@@ -32,3 +39,32 @@ async def translate_document(req: TranslateRequest):
     job_id = await enqueue_translation_job(chapters_input, req.target_language)
     logger.info(f"Translation job {job_id} queued for session {req.session_id}")
     return {"job_id": job_id}
+
+@router.post("/translate/chapter")
+async def translate_chapter(req: ChapterTranslateRequest):
+    """
+    Translates a single chapter on the priority lane and returns the result directly.
+    Intended for interactive edits; does not wait behind queued translation jobs.
+    """
+    if not is_valid_language_code(req.target_language):
+        raise HTTPException(status_code=400, detail="Invalid target language code")
+
+    chapters = get_doc(req.session_id)
+    if not chapters:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    try:
+        result = await translate_single_chapter(
+            chapters,
+            req.chapter_id,
+            req.target_language,
+            markdown=req.markdown
+        )
+    except Exception as e:
+        logger.exception(f"Priority translation failed for chapter {req.chapter_id} of session {req.session_id}")
+        raise HTTPException(status_code=502, detail="Translation failed") from e
+    if result is None:
+        raise HTTPException(status_code=404, detail="Chapter not found")
+
+    logger.info(f"Chapter {req.chapter_id} of session {req.session_id} translated")
+    return result
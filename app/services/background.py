@@ -1,7 +1,8 @@
 import asyncio
 import logging
-from typing import Optional
-from app.services.llm_integration import translate_text_with_context
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from app.services.llm_integration import translate_text_with_context, request_translation
 from app.services.storage import get_translation_job, update_translation_job
 from app.core.config import settings
 
@@ -11,6 +12,9 @@ logger = logging.getLogger(__name__)
 translation_queue: Optional[asyncio.Queue] = None
 # Track the background worker tasks
 worker_tasks = []
+# Dedicated thread pool for interactive single-chapter translations, kept
+# separate from the bulk workers so queued documents cannot starve it
+priority_executor: Optional[ThreadPoolExecutor] = None
 
 async def translation_worker(worker_id: int):
     """
@@ -27,6 +31,15 @@ async def translation_worker(worker_id: int):
         await process_translation_job(job_id)
         translation_queue.task_done()
 
+def get_chapter_context(chapters: List[dict], index: int) -> Tuple[str, str]:
+    """
+    Return the Markdown of the chapters before and after the given index,
+    used as translation context. Missing neighbours yield empty strings.
+    """
+    context_before = chapters[index-1]['markdown'] if index > 0 else ""
+    context_after = chapters[index+1]['markdown'] if index < len(chapters)-1 else ""
+    return context_before, context_after
+
 async def process_translation_job(job_id: str):
     """
     Process the given translation job by sequentially translating each chapter.
@@ -46,10 +59,10 @@ async def process_translation_job(job_id: str):
         
         for i, chap in enumerate(job["chapters"]):
             try:
-                context_before = job["chapters"][i-1]['markdown'] if i > 0 else ""
-                context_after = job["chapters"][i+1]['markdown'] if i < len(job["chapters"])-1 else ""
+                context_before, context_after = get_chapter_context(job["chapters"], i)
                 
-                translated = translate_text_with_context(
+                translated = await asyncio.to_thread(
+                    translate_text_with_context,
                     chap['markdown'],
                     context_before,
                     context_after,
@@ -95,11 +108,34 @@ def add_translation_task(job_id: str):
 
     translation_queue.put_nowait(job_id)
 
+async def run_priority_translation(text: str, context_before: str, context_after: str, target_language: str) -> str:
+    """
+    Translate a single piece of text on the priority lane and return the result.
+    Bypasses the job queue entirely and runs on its own thread pool.
+    Raises if the translation fails.
+    """
+    global priority_executor
+    if priority_executor is None:
+        priority_executor = ThreadPoolExecutor(
+            max_workers=settings.MAX_CONCURRENT_PRIORITY_TRANSLATIONS,
+            thread_name_prefix="priority-translation"
+        )
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        priority_executor,
+        request_translation,
+        text,
+        context_before,
+        context_after,
+        target_language
+    )
+
 async def shutdown_background_tasks():
     """
     Gracefully shutdown background workers.
     """
-    global translation_queue, worker_tasks
+    global translation_queue, worker_tasks, priority_executor
     if translation_queue is not None:
         # Send shutdown signal
         for _ in worker_tasks:
@@ -107,4 +143,7 @@ async def shutdown_background_tasks():
         await asyncio.gather(*worker_tasks, return_exceptions=True)
         worker_tasks.clear()
         translation_queue = None
+    if priority_executor is not None:
+        priority_executor.shutdown(wait=False, cancel_futures=True)
+        priority_executor = None
     logger.info("All background tasks shut down.")
@@ -12,10 +12,11 @@ client = AzureOpenAI(
     timeout=30.0
 )
 
-def translate_text_with_context(text: str, context_before: str, context_after: str, target_language: str) -> str:
+def request_translation(text: str, context_before: str, context_after: str, target_language: str) -> str:
     """
     Uses Azure OpenAI to translate text.
     Provides context (previous and next chapter) to improve accuracy.
+    Raises on failure.
     """
     prompt = (
         f"Translate the following text into {target_language}. "
@@ -28,14 +29,20 @@ def translate_text_with_context(text: str, context_before: str, context_after: s
         f"Context After:\n{context_after}\n\n"
         "Translated Text:"
     )
+    response = client.chat.completions.create(
+        model=settings.AZURE_OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.1,
+        max_tokens=4000  # Increased token limit to handle larger texts
+    )
+    return response.choices[0].message.content.strip()
+
+def translate_text_with_context(text: str, context_before: str, context_after: str, target_language: str) -> str:
+    """
+    Same as request_translation, but returns a placeholder message instead of raising.
+    """
     try:
-        response = client.chat.completions.create(
-            model=settings.AZURE_OPENAI_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=4000  # Increased token limit to handle larger texts
-        )
-        return response.choices[0].message.content.strip()
+        return request_translation(text, context_before, context_after, target_language)
     except Exception as e:
         logger.exception("AOAI Translation failed")
         return "Translation failed due to an internal error."
@@ -1,8 +1,8 @@
 import uuid
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pydantic import BaseModel
 from app.services.storage import store_translation_job, get_translation_job, update_translation_job
-from app.services.background import add_translation_task
+from app.services.background import add_translation_task, get_chapter_context, run_priority_translation
 from app.services.validation import sanitize_language_code
 import logging
 
@@ -38,4 +38,33 @@ async def enqueue_translation_job(chapters: List[TranslationChapterInput], targe
     # Enqueue for background processing
     add_translation_task(job_id)
     logger.info(f"Translation job {job_id} created and enqueued.")
-    return job_id
\ No newline at end of file
+    return job_id
+
+async def translate_single_chapter(
+    chapters: List[dict],
+    chapter_id: str,
+    target_language: str,
+    markdown: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Translate one chapter of a stored document on the priority lane.
+    Uses the neighbouring chapters as context, like the bulk jobs do.
+    Returns None if the chapter does not exist in the document.
+    The target language is expected to be validated by the caller.
+    Raises if the translation fails.
+    """
+    target_language = target_language.strip().lower()
+    index = next((i for i, ch in enumerate(chapters) if ch["id"] == chapter_id), None)
+    if index is None:
+        return None
+
+    source = markdown if markdown is not None else chapters[index]["markdown"]
+    context_before, context_after = get_chapter_context(chapters, index)
+
+    translated = await run_priority_translation(source, context_before, context_after, target_language)
+    logger.info(f"Chapter {chapter_id} translated to {target_language} on the priority lane.")
+    return {
+        "id": chapter_id,
+        "target_language": target_language,
+        "translated_markdown": translated
+    }
@@ -11,8 +11,13 @@ def sanitize_language_code(lang: str) -> str:
     Basic validation/sanitization of language code.
     Just ensures it's alphanumeric and short.
     """
-    lang = lang.strip().lower()
-    if not re.match(r'^[a-z]{2,5}$', lang):
+    if not is_valid_language_code(lang):
         # fallback to 'en' if invalid
         return 'en'
-    return lang
+    return lang.strip().lower()
+
+def is_valid_language_code(lang: str) -> bool:
+    """
+    Check whether a language code is alphanumeric and short.
+    """
+    return bool(re.match(r'^[a-z]{2,5}$', lang.strip().lower()))